@@ -11,7 +11,7 @@ ARCHITECTURE OVERVIEW:
 ----------------------
 1. RSS Fetching: Downloads news articles from RSS/Atom feeds
 2. Classification: Groups articles into topics based on keywords  
-3. Storage: Saves articles to JSON files (simple persistence)
+3. Storage: Appends articles to JSONL files (simple persistence)
 4. Reporting: Generates markdown reports with top articles per topic
 
 HOW TO BUILD IT OUT:
@@ -26,6 +26,9 @@ DEPENDENCIES TO INSTALL:
 ------------------------
 pip install feedparser requests pyyaml
 
+Optional (faster fetching and classification):
+pip install aiohttp pyahocorasick orjson
+
 USAGE:
 ------
 python main.py --help
@@ -35,12 +38,26 @@ python main.py --topics tech,ai,security
 """
 
 import argparse
+import asyncio
 import hashlib
+import heapq
 import json
 import logging
+import mmap
+import multiprocessing
+import os
+import re
+import sqlite3
+import urllib.error
+import urllib.request
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Pattern, Tuple)
 from urllib.parse import urlparse
 
 # External dependencies
@@ -52,6 +69,38 @@ except ImportError as e:
     print("Install with: pip install feedparser pyyaml")
     exit(1)
 
+# Optional dependency: async fetching (falls back to a thread pool)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional dependency: fast multi-keyword matching (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional dependency: faster JSON encoding/decoding (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+
+def json_loads(data):
+    """Parse JSON from bytes or a memoryview, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
 
 # ============================================================================
 # DATA MODELS
@@ -59,18 +108,37 @@ except ImportError as e:
 
 class Article:
     """Simple article data model"""
+    # Fixed attribute slots: smaller instances and faster attribute access
+    # than a per-instance __dict__
+    __slots__ = ('id', 'title', 'url', 'source', 'summary', 'published',
+                 'topics', '_search_lower')
+    
     def __init__(self, title: str, url: str, source: str, 
-                 summary: Optional[str] = None, published: Optional[str] = None):
+                 summary: Optional[str] = None, published: Optional[str] = None,
+                 id: Optional[str] = None):
         self.title = title
         self.url = url
         self.source = source
         self.summary = summary or ""
         self.published = published or datetime.now(timezone.utc).isoformat()
         self.topics: List[str] = []
+        self._search_lower: Optional[str] = None
         
-        # Generate unique ID from content
-        content = f"{source}|{url}|{title}"
-        self.id = hashlib.md5(content.encode()).hexdigest()[:12]
+        # Generate unique ID from content (12 hex chars), unless one is given
+        if id:
+            self.id = id
+        else:
+            content = f"{source}|{url}|{title}"
+            h = hashlib.blake2b(digest_size=6)
+            h.update(content.encode('utf-8', 'ignore'))
+            self.id = h.hexdigest()
+    
+    @property
+    def search_text(self) -> str:
+        """Lowercased title + summary used for keyword matching (cached)"""
+        if self._search_lower is None:
+            self._search_lower = f"{self.title} {self.summary}".lower()
+        return self._search_lower
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
@@ -92,13 +160,18 @@ class Article:
             url=data['url'],
             source=data['source'],
             summary=data.get('summary'),
-            published=data.get('published')
+            published=data.get('published'),
+            id=data.get('id')
         )
-        art.id = data.get('id', art.id)
         art.topics = data.get('topics', [])
         return art
 
 
+def _is_word_char(char: str) -> bool:
+    """True for characters regex \\w would match (letters, digits, '_')"""
+    return char.isalnum() or char == '_'
+
+
 class Topic:
     """Topic configuration with keywords"""
     def __init__(self, name: str, keywords: List[str], 
@@ -106,28 +179,109 @@ class Topic:
         self.name = name
         self.keywords = [k.lower() for k in keywords]
         self.exclude_words = [k.lower() for k in (exclude_words or [])]
+        
+        # One compiled pattern per word list: the scan runs in C and stops
+        # at the first hit, instead of looping over keywords in Python
+        self._include_re = self._compile(self.keywords)
+        self._exclude_re = self._compile(self.exclude_words)
+    
+    @staticmethod
+    def _compile(words: List[str]) -> Optional[Pattern[str]]:
+        """
+        Compile words into one case-insensitive whole-word pattern
+        
+        Whole words only, so 'ai' matches "AI news" but not "fails".
+        Lookarounds are used instead of \\b so keywords that start or end
+        with punctuation (like 'c++') still work.
+        """
+        words = [w for w in words if w]
+        if not words:
+            return None
+        alternation = "|".join(re.escape(w) for w in words)
+        return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
     
     def matches(self, text: str) -> bool:
         """Check if text matches this topic's keywords"""
-        text_lower = text.lower()
-        
         # Check exclude words first
-        if any(word in text_lower for word in self.exclude_words):
+        if self._exclude_re and self._exclude_re.search(text):
             return False
         
         # Check include keywords
-        return any(keyword in text_lower for keyword in self.keywords)
+        return bool(self._include_re and self._include_re.search(text))
 
 
 # ============================================================================
 # RSS FETCHER
 # ============================================================================
 
+class FeedResponse(NamedTuple):
+    """Result of downloading one feed"""
+    url: str
+    source_name: str
+    status: int                     # HTTP status; 304 means "not modified"
+    body: bytes = b""
+    content_type: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cached: Optional[dict] = None   # Cached copy of the feed, if any
+
+
+def _parse_feed(body: bytes, content_type: str = "") -> List[dict]:
+    """
+    Parse raw feed bytes into plain entry dicts
+    
+    This is the CPU-heavy part of fetching, so RSSFetcher.fetch_all runs
+    it in worker processes. It returns dicts rather than Articles, which
+    are cheaper to send back to the parent process.
+    """
+    logger = logging.getLogger(__name__)
+    
+    try:
+        feed = feedparser.parse(body, response_headers={'content-type': content_type})
+    except Exception as e:
+        logger.error(f"Failed to parse feed: {e}")
+        return []
+    
+    entries = []
+    for entry in feed.entries[:20]:  # Limit to 20 articles per feed
+        try:
+            # Try to parse published date
+            published = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                published = dt.isoformat()
+            
+            entries.append({
+                # Extract basic info
+                'title': entry.get('title', 'No Title'),
+                'url': entry.get('link', entry.get('id', '')),
+                # Try to get summary/description
+                'summary': (entry.get('summary') or 
+                            entry.get('description') or 
+                            '')[:500],  # Limit summary length
+                'published': published
+            })
+            
+        except Exception as e:
+            logger.warning(f"Skipping article due to error: {e}")
+            continue
+    
+    return entries
+
+
 class RSSFetcher:
     """Fetches articles from RSS/Atom feeds"""
     
-    def __init__(self):
+    USER_AGENT = "NewsAgg-Mini/1.0"
+    # Below this much feed data in total, starting a process pool costs
+    # more than parsing everything in-process
+    PARALLEL_PARSE_BYTES = 1 << 20
+    
+    def __init__(self, storage: Optional['Storage'] = None):
         self.logger = logging.getLogger(__name__)
+        # When set, feeds are cached so unchanged ones can be skipped
+        # with a conditional GET (ETag / Last-Modified)
+        self.storage = storage
     
     def fetch(self, feed_url: str, source_name: Optional[str] = None) -> List[Article]:
         """
@@ -140,50 +294,216 @@ class RSSFetcher:
         Returns:
             List of Article objects
         """
-        if not source_name:
-            # Extract domain as source name
-            source_name = urlparse(feed_url).netloc
+        response = self.download(feed_url, source_name)
+        if response is None:
+            return []
+        
+        entries = None
+        if response.status != 304:
+            entries = _parse_feed(response.body, response.content_type)
+        return self._articles_from(response, entries)
+    
+    def fetch_all(self, feeds: List[dict]) -> List[Article]:
+        """
+        Fetch articles from many feeds concurrently
+        
+        Downloads run concurrently (asyncio + aiohttp when installed,
+        otherwise a thread pool), so total time is roughly the slowest
+        feed, not the sum. Parsing is CPU-bound and holds the GIL, so it
+        runs in a process pool when there's more than one feed to parse.
+        """
+        if not feeds:
+            return []
         
+        # Stage 1: download
+        urls = [feed['url'] for feed in feeds]
+        names = [feed.get('name') for feed in feeds]
+        if aiohttp is not None:
+            responses = asyncio.run(self._download_all_async(urls, names))
+        else:
+            with ThreadPoolExecutor(max_workers=min(10, len(feeds))) as executor:
+                responses = list(executor.map(self.download, urls, names))
+        responses = [r for r in responses if r is not None]
+        
+        # Stage 2: parse (feeds that weren't modified are skipped)
+        to_parse = [r for r in responses if r.status != 304]
+        bodies = [r.body for r in to_parse]
+        content_types = [r.content_type for r in to_parse]
+        workers = min(len(to_parse), os.cpu_count() or 1)
+        if workers > 1 and sum(map(len, bodies)) >= self.PARALLEL_PARSE_BYTES:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_parse_feed, bodies, content_types))
+        else:
+            parsed = [_parse_feed(b, c) for b, c in zip(bodies, content_types)]
+        entries_by_url = {r.url: entries for r, entries in zip(to_parse, parsed)}
+        
+        # Stage 3: build Article objects here, in the parent process
+        all_articles = []
+        for response in responses:
+            all_articles.extend(
+                self._articles_from(response, entries_by_url.get(response.url)))
+        
+        # Drop duplicates (e.g. the same feed listed twice), keeping the first
+        seen_ids = set()
+        unique = []
+        for article in all_articles:
+            if article.id not in seen_ids:
+                seen_ids.add(article.id)
+                unique.append(article)
+        return unique
+    
+    def download(self, feed_url: str,
+                 source_name: Optional[str] = None) -> Optional[FeedResponse]:
+        """Download a feed's raw bytes (None if the request failed)"""
+        source_name = self._source_name(feed_url, source_name)
         self.logger.info(f"Fetching RSS: {source_name} ({feed_url})")
         
+        if self._is_local(feed_url):
+            return self._read_local(feed_url, source_name)
+        
+        cached = self._load_cache(feed_url)
+        request = urllib.request.Request(feed_url, headers=self._headers(cached))
+        
         try:
-            feed = feedparser.parse(feed_url)
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return FeedResponse(
+                    url=feed_url,
+                    source_name=source_name,
+                    status=response.status,
+                    body=response.read(),
+                    content_type=response.headers.get('Content-Type', ''),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    cached=cached
+                )
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return FeedResponse(url=feed_url, source_name=source_name,
+                                    status=304, cached=cached)
+            self.logger.error(f"Failed to fetch {feed_url}: {e}")
+            return None
         except Exception as e:
             self.logger.error(f"Failed to fetch {feed_url}: {e}")
-            return []
+            return None
+    
+    async def download_async(self, session, feed_url: str,
+                             source_name: Optional[str] = None
+                             ) -> Optional[FeedResponse]:
+        """Like download(), using a shared aiohttp session"""
+        source_name = self._source_name(feed_url, source_name)
+        self.logger.info(f"Fetching RSS: {source_name} ({feed_url})")
         
-        articles = []
-        for entry in feed.entries[:20]:  # Limit to 20 articles per feed
-            try:
-                # Extract basic info
-                title = entry.get('title', 'No Title')
-                url = entry.get('link', entry.get('id', ''))
-                
-                # Try to get summary/description
-                summary = (entry.get('summary') or 
-                          entry.get('description') or 
-                          '')[:500]  # Limit summary length
-                
-                # Try to parse published date
-                published = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                    published = dt.isoformat()
-                
-                article = Article(
-                    title=title,
-                    url=url,
-                    source=source_name,
-                    summary=summary,
-                    published=published
+        if self._is_local(feed_url):
+            return self._read_local(feed_url, source_name)
+        
+        cached = self._load_cache(feed_url)
+        
+        try:
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with session.get(feed_url, headers=self._headers(cached),
+                                   timeout=timeout) as response:
+                if response.status == 304:
+                    return FeedResponse(url=feed_url, source_name=source_name,
+                                        status=304, cached=cached)
+                response.raise_for_status()
+                return FeedResponse(
+                    url=feed_url,
+                    source_name=source_name,
+                    status=response.status,
+                    body=await response.read(),
+                    content_type=response.headers.get('Content-Type', ''),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    cached=cached
                 )
-                articles.append(article)
-                
-            except Exception as e:
-                self.logger.warning(f"Skipping article due to error: {e}")
-                continue
+        except Exception as e:
+            self.logger.error(f"Failed to fetch {feed_url}: {e}")
+            return None
+    
+    async def _download_all_async(self, urls: List[str],
+                                  names: List[Optional[str]]
+                                  ) -> List[Optional[FeedResponse]]:
+        """Download all feeds concurrently over one pooled HTTP session"""
+        # Cap connections overall and per host so we stay polite to servers
+        connector = aiohttp.TCPConnector(limit=256, limit_per_host=8)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*(
+                self.download_async(session, url, name)
+                for url, name in zip(urls, names)
+            ))
+    
+    @staticmethod
+    def _is_local(feed_url: str) -> bool:
+        """True for a plain file path (feedparser accepts these too)"""
+        return "://" not in feed_url
+    
+    def _read_local(self, feed_url: str, source_name: str) -> Optional[FeedResponse]:
+        """Read a feed from a local file"""
+        try:
+            body = Path(feed_url).read_bytes()
+        except Exception as e:
+            self.logger.error(f"Failed to fetch {feed_url}: {e}")
+            return None
+        return FeedResponse(url=feed_url, source_name=source_name,
+                            status=200, body=body)
+    
+    @staticmethod
+    def _source_name(feed_url: str, source_name: Optional[str]) -> str:
+        """Use the given source name, or the feed's domain"""
+        return source_name or urlparse(feed_url).netloc
+    
+    def _headers(self, cached: dict) -> Dict[str, str]:
+        """Request headers, including conditional-GET validators if cached"""
+        headers = {'User-Agent': self.USER_AGENT}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def _articles_from(self, response: FeedResponse,
+                       entries: Optional[List[dict]]) -> List[Article]:
+        """Turn a downloaded feed (and its parsed entries) into Articles"""
+        if response.status == 304:
+            if not response.cached:
+                return []
+            return self._from_cache(response.cached, response.source_name)
         
-        self.logger.info(f"Fetched {len(articles)} articles from {source_name}")
+        # Fallback date for undated entries, computed once per feed
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        articles = [
+            Article(
+                title=entry['title'],
+                url=entry['url'],
+                source=response.source_name,
+                summary=entry['summary'],
+                published=entry['published'] or now_iso
+            )
+            for entry in entries or []
+        ]
+        
+        self.logger.info(f"Fetched {len(articles)} articles from {response.source_name}")
+        self._save_cache(response.url, response.etag, response.last_modified, articles)
+        return articles
+    
+    def _load_cache(self, feed_url: str) -> dict:
+        """Return the cached copy of a feed, or {} if there isn't one"""
+        if self.storage is None:
+            return {}
+        return self.storage.load_feed_cache(feed_url) or {}
+    
+    def _save_cache(self, feed_url: str, etag: Optional[str],
+                    last_modified: Optional[str], articles: List[Article]):
+        """Cache a feed's articles if the server gave us validators"""
+        if self.storage is not None and (etag or last_modified):
+            self.storage.save_feed_cache(feed_url, etag, last_modified, articles)
+    
+    def _from_cache(self, cached: dict, source_name: str) -> List[Article]:
+        """Rebuild articles from a cached feed after a 304 Not Modified"""
+        articles = [Article.from_dict(d) for d in cached.get('articles', [])]
+        self.logger.info(f"Not modified: {source_name} "
+                         f"({len(articles)} cached articles)")
         return articles
 
 
@@ -194,30 +514,221 @@ class RSSFetcher:
 class Classifier:
     """Classifies articles into topics based on keywords"""
     
-    def __init__(self, topics: List[Topic]):
+    # Matching in a process pool only pays off for big batches on several
+    # cores. Measured with the default topics: in-process matching costs
+    # ~7 us/article; the pool adds ~22 ms startup plus ~4 us/article of
+    # pickling and IPC in the parent. That never wins with 2 workers and
+    # breaks even around 17k articles with 4 (about 10k with 8).
+    PARALLEL_THRESHOLD = 20000
+    PARALLEL_MIN_WORKERS = 4
+    # Above this many keywords in total, Aho-Corasick beats a generated matcher
+    CODEGEN_MAX_KEYWORDS = 500
+    # Bump when the layout of match cache entries changes
+    MATCH_CACHE_VERSION = 2
+    
+    def __init__(self, topics: List[Topic], match_cache: Optional[dict] = None):
         self.topics = topics
         self.logger = logging.getLogger(__name__)
+        
+        # article id -> [hash of its search text, matched topic names],
+        # carried over between runs. An entry is only reused if the text
+        # is unchanged (feeds do edit summaries) and the file only if the
+        # topics (names and keywords) haven't changed.
+        self.fingerprint = self._fingerprint(topics)
+        match_cache = match_cache or {}
+        if match_cache.get('fingerprint') == self.fingerprint:
+            self.match_cache: Dict[str, list] = match_cache.get('matches', {})
+        else:
+            self.match_cache = {}
+        self._used_ids: set = set()
+        
+        # For a normal-sized config, generate a matcher specialized to these
+        # exact topics (see _generate_matcher)
+        self._generated = None
+        if sum(len(t.keywords) for t in topics) <= self.CODEGEN_MAX_KEYWORDS:
+            self._generated = self._generate_matcher(topics)
+        
+        # Otherwise one automaton over every topic's keywords lets us scan
+        # each article once instead of once per keyword per topic
+        self.ac = None
+        self.exclude_ac = None
+        if self._generated is None and ahocorasick is not None:
+            self.ac = self._build_automaton(
+                {i: t.keywords for i, t in enumerate(topics)})
+            self.exclude_ac = self._build_automaton(
+                {i: t.exclude_words for i, t in enumerate(topics)})
     
-    def classify(self, articles: List[Article]) -> Dict[str, List[Article]]:
+    @staticmethod
+    def _fingerprint(topics: List[Topic]) -> str:
+        """Hash of the topic configuration, used to invalidate the match cache"""
+        config = [Classifier.MATCH_CACHE_VERSION]
+        config += [[t.name, t.keywords, t.exclude_words] for t in topics]
+        return hashlib.sha1(json.dumps(config).encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _text_hash(article: Article) -> str:
+        """Short hash of the text an article is matched on"""
+        return hashlib.blake2b(article.search_text.encode('utf-8'),
+                               digest_size=8).hexdigest()
+    
+    def _cached_topics(self, article: Article, text_hash: str) -> Optional[List[str]]:
+        """Topic names cached for this article, unless its text has changed"""
+        entry = self.match_cache.get(article.id)
+        if entry is not None and entry[0] == text_hash:
+            return entry[1]
+        return None
+    
+    def export_match_cache(self) -> dict:
+        """Match cache to persist, limited to articles seen by this run"""
+        return {
+            'fingerprint': self.fingerprint,
+            'matches': {i: self.match_cache[i] for i in self._used_ids}
+        }
+    
+    @staticmethod
+    def _generate_matcher(topics: List[Topic]) -> Callable[[str], List[Topic]]:
+        """
+        Compile a function with one flat `if` per topic, e.g.:
+        
+            def _match(text):
+                out = []
+                if not exclude_0(text) and include_0(text):
+                    out.append(topic_0)
+                ...
+                return out
+        
+        where include_N / exclude_N are the topic's bound regex search
+        methods. This skips the loop over Topic objects and the method
+        lookups on every article. Only index-based names go into the
+        source; keywords and topic names never do.
+        """
+        namespace = {}
+        lines = ["def _match(text):", "    out = []"]
+        for i, topic in enumerate(topics):
+            if topic._include_re is None:
+                continue  # No keywords, never matches
+            namespace[f"topic_{i}"] = topic
+            namespace[f"include_{i}"] = topic._include_re.search
+            condition = f"include_{i}(text)"
+            if topic._exclude_re is not None:
+                namespace[f"exclude_{i}"] = topic._exclude_re.search
+                condition = f"not exclude_{i}(text) and {condition}"
+            lines.append(f"    if {condition}:")
+            lines.append(f"        out.append(topic_{i})")
+        lines.append("    return out")
+        
+        code = compile("\n".join(lines) + "\n", "<generated matcher>", "exec")
+        exec(code, namespace)
+        return namespace["_match"]
+    
+    @staticmethod
+    def _build_automaton(words_by_topic: Dict[int, List[str]]):
+        """Build an Aho-Corasick automaton mapping each word to topic indexes"""
+        topics_by_word: Dict[str, set] = {}
+        for topic_idx, words in words_by_topic.items():
+            for word in words:
+                topics_by_word.setdefault(word, set()).add(topic_idx)
+        
+        if not topics_by_word:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for word, topic_idxs in topics_by_word.items():
+            automaton.add_word(word, (len(word), frozenset(topic_idxs)))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _scan(automaton, text: str) -> set:
+        """Return the indexes of topics with a whole word found in text"""
+        hits = set()
+        if automaton is not None:
+            for end, (length, topic_idxs) in automaton.iter(text):
+                # Same whole-word rule as Topic.matches
+                start = end - length + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                hits.update(topic_idxs)
+        return hits
+    
+    def _matching_topics(self, text_lower: str) -> List[Topic]:
+        """Return the topics that match the lowercased text"""
+        if self._generated is not None:
+            return self._generated(text_lower)
+        
+        if self.ac is None and self.exclude_ac is None:
+            return [t for t in self.topics if t.matches(text_lower)]
+        
+        excluded = self._scan(self.exclude_ac, text_lower)
+        hits = self._scan(self.ac, text_lower) - excluded
+        return [self.topics[i] for i in sorted(hits)]
+    
+    def _match_in_pool(self, pending: List[Tuple[Article, str]], workers: int):
+        """Fill the match cache for (article, text hash) pairs using a process pool"""
+        texts = [article.search_text for article, _ in pending]
+        # One contiguous shard of articles per worker
+        shard_size = -(-len(texts) // workers)
+        with multiprocessing.Pool(workers, initializer=_init_worker,
+                                  initargs=(self.topics,)) as pool:
+            results = pool.map(_match_topic_names, texts, chunksize=shard_size)
+        
+        for (article, text_hash), topic_names in zip(pending, results):
+            self.match_cache[article.id] = [text_hash, topic_names]
+    
+    def classify(self, articles: Iterable[Article],
+                 on_match: Optional[Callable[[str, Article], None]] = None
+                 ) -> Dict[str, List[Article]]:
         """
         Classify articles into topics
         
+        Args:
+            articles: Articles to classify (any iterable, consumed once;
+                      pass a list to allow matching in a process pool)
+            on_match: Optional callback, called as on_match(topic_name, article)
+                      for every match, e.g. to save articles in the same pass
+        
         Returns:
             Dictionary mapping topic names to lists of articles
         """
         result = {topic.name: [] for topic in self.topics}
         result['uncategorized'] = []
         
-        for article in articles:
-            # Create searchable text from title and summary
-            search_text = f"{article.title} {article.summary}"
+        # Big batches are matched up front across all CPU cores. Only done
+        # for lists/tuples, so a streamed iterable is never materialized.
+        # Each article's text hash is computed once and reused below.
+        workers = os.cpu_count() or 1
+        text_hashes = None
+        if (workers >= self.PARALLEL_MIN_WORKERS and isinstance(articles, Sequence)
+                and len(articles) >= self.PARALLEL_THRESHOLD):
+            text_hashes = [self._text_hash(a) for a in articles]
+            pending = [(a, h) for a, h in zip(articles, text_hashes)
+                       if self._cached_topics(a, h) is None]
+            if len(pending) >= self.PARALLEL_THRESHOLD:
+                self._match_in_pool(pending, workers)
+        
+        for i, article in enumerate(articles):
+            # Articles already classified by an earlier run skip matching
+            if text_hashes is not None:
+                text_hash = text_hashes[i]
+            else:
+                text_hash = self._text_hash(article)
+            topic_names = self._cached_topics(article, text_hash)
+            if topic_names is None:
+                # Lowercased title + summary, computed once per article
+                search_text = article.search_text
+                topic_names = [t.name for t in self._matching_topics(search_text)]
+                self.match_cache[article.id] = [text_hash, topic_names]
+            self._used_ids.add(article.id)
             
             matched = False
-            for topic in self.topics:
-                if topic.matches(search_text):
-                    result[topic.name].append(article)
-                    article.topics.append(topic.name)
-                    matched = True
+            for topic_name in topic_names:
+                result[topic_name].append(article)
+                article.topics.append(topic_name)
+                matched = True
+                if on_match is not None:
+                    on_match(topic_name, article)
             
             if not matched:
                 result['uncategorized'].append(article)
@@ -232,64 +743,261 @@ class Classifier:
         return result
 
 
+# Per-process classifier for Classifier._match_in_pool workers
+_worker_classifier: Optional[Classifier] = None
+
+
+def _init_worker(topics: List[Topic]):
+    """Pool initializer: build the keyword matchers once per worker"""
+    global _worker_classifier
+    _worker_classifier = Classifier(topics)
+
+
+def _match_topic_names(text_lower: str) -> List[str]:
+    """Pool task: names of the topics matching one article's search text"""
+    return [t.name for t in _worker_classifier._matching_topics(text_lower)]
+
+
 # ============================================================================
 # STORAGE
 # ============================================================================
 
 class Storage:
-    """Simple JSON-based storage for articles"""
+    """
+    Simple file-based storage for articles
+    
+    Each topic has an append-only JSONL file (one article per line).
+    The ids already saved per topic are kept in a small SQLite table, so
+    saving only touches the new articles instead of re-reading every file.
+    """
+    
+    MAX_ARTICLES = 100  # Articles kept per topic
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        
+        self.db = sqlite3.connect(self.data_dir / "seen.db")
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "topic TEXT NOT NULL, id TEXT NOT NULL, PRIMARY KEY (topic, id))"
+        )
+        self.db.commit()
+    
+    def close(self):
+        """Close the seen-ids database"""
+        self.db.close()
+    
+    def articles_path(self, topic: str = "all") -> Path:
+        """Path of a topic's JSONL file"""
+        return self.data_dir / f"{topic}_articles.jsonl"
     
     def save_articles(self, articles: List[Article], topic: str = "all"):
-        """Save articles to a JSON file"""
-        file_path = self.data_dir / f"{topic}_articles.json"
+        """Append new articles to the topic's JSONL file"""
+        with self.open_writers([topic]) as writers:
+            for article in articles:
+                writers[topic].write(article)
+        return writers[topic].saved
+    
+    @contextmanager
+    def open_writers(self, topics: List[str]) -> Iterator[Dict[str, 'ArticleWriter']]:
+        """
+        Open one writer per topic for streaming articles in as they arrive
+        
+        New records are buffered in memory. Only when the block exits
+        cleanly are they appended to the files and the seen ids committed;
+        then any file that has grown too large is compacted.
+        """
+        writers = {topic: ArticleWriter(self, topic) for topic in topics}
+        # If the block raises (even Ctrl-C), nothing has been written yet and
+        # the ids are rolled back. If an append itself fails, the ids are
+        # rolled back too; lines that did get written are harmless, because
+        # load_articles and compact keep one record per id.
+        with self.db:
+            yield writers
+            for writer in writers.values():
+                writer.flush()
+        
+        for topic, writer in writers.items():
+            self.logger.info(f"Saved {writer.saved} new articles to {writer.path}")
+            # Appending is cheap but grows the file; trim it back now and then
+            if writer.saved and self._count_lines(writer.path) > 2 * self.MAX_ARTICLES:
+                try:
+                    self.compact(topic)
+                except Exception as e:
+                    self.logger.warning(f"Could not compact {writer.path}: {e}")
+    
+    def compact(self, topic: str = "all"):
+        """Rewrite a topic's JSONL file keeping only the most recent articles"""
+        file_path = self.articles_path(topic)
+        
+        records = self._newest(self.iter_articles(topic))
         
-        # Load existing articles if file exists
-        existing_ids = set()
-        existing_articles = []
+        # Write to a temp file and swap it in, so a crash can't lose data.
+        # Dropped ids stay in the seen table so they aren't re-added.
+        tmp_path = file_path.with_suffix('.jsonl.tmp')
+        tmp_path.write_bytes(b"".join(json_dumps(d) + b"\n" for d in records))
+        os.replace(tmp_path, file_path)
         
-        if file_path.exists():
-            try:
-                with open(file_path, 'r') as f:
-                    existing_data = json.load(f)
-                    existing_articles = [Article.from_dict(d) for d in existing_data]
-                    existing_ids = {a.id for a in existing_articles}
-            except Exception as e:
-                self.logger.warning(f"Could not load existing articles: {e}")
+        self.logger.info(f"Compacted {file_path} to {len(records)} articles")
+    
+    def _newest(self, records: Iterable[dict]) -> List[dict]:
+        """The most recent MAX_ARTICLES records, keeping one record per id"""
+        unique = {}
+        for record in records:
+            unique.setdefault(record.get('id'), record)
+        return heapq.nlargest(self.MAX_ARTICLES, unique.values(),
+                              key=lambda d: d.get('published') or "")
+    
+    @staticmethod
+    def _count_lines(file_path: Path) -> int:
+        """Count the records in a JSONL file"""
+        with open(file_path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+    
+    def iter_articles(self, topic: str = "all") -> Iterator[dict]:
+        """Stream a topic's stored records one line at a time"""
+        file_path = self.articles_path(topic)
         
-        # Add only new articles
-        new_articles = [a for a in articles if a.id not in existing_ids]
-        all_articles = existing_articles + new_articles
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return
+        
+        with self._mapped(file_path) as mm:
+            for line_no, line in enumerate(iter(mm.readline, b""), 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json_loads(line)
+                except ValueError as e:
+                    # e.g. a partial line left by a crash mid-append
+                    self.logger.warning(f"Skipping bad record at {file_path}:{line_no}: {e}")
+    
+    @staticmethod
+    @contextmanager
+    def _mapped(file_path: Path) -> Iterator[mmap.mmap]:
+        """
+        Memory-map a (non-empty) file read-only
+        
+        The parser reads straight from the page cache, skipping the
+        copy into a userspace read buffer.
+        """
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+    
+    def _read_json(self, file_path: Path):
+        """Parse a whole JSON file straight from a memory map"""
+        if file_path.stat().st_size == 0:
+            raise ValueError(f"{file_path} is empty")
+        with self._mapped(file_path) as mm, memoryview(mm) as view:
+            return json_loads(view)
+    
+    def feed_cache_path(self, feed_url: str) -> Path:
+        """Path of the conditional-GET cache file for a feed"""
+        digest = hashlib.sha1(feed_url.encode('utf-8')).hexdigest()
+        return self.data_dir / "feeds" / f"{digest}.json"
+    
+    def load_feed_cache(self, feed_url: str) -> Optional[dict]:
+        """Load a feed's cached validators and articles, if any"""
+        file_path = self.feed_cache_path(feed_url)
         
-        # Keep only the most recent 100 articles
-        all_articles.sort(key=lambda a: a.published or "", reverse=True)
-        all_articles = all_articles[:100]
+        if not file_path.exists():
+            return None
         
-        # Save to file
-        with open(file_path, 'w') as f:
-            json.dump([a.to_dict() for a in all_articles], f, indent=2)
+        try:
+            return self._read_json(file_path)
+        except Exception as e:
+            self.logger.warning(f"Could not load feed cache: {e}")
+            return None
+    
+    def save_feed_cache(self, feed_url: str, etag: Optional[str],
+                        last_modified: Optional[str], articles: List[Article]):
+        """Save a feed's validators (ETag / Last-Modified) and articles"""
+        file_path = self.feed_cache_path(feed_url)
         
-        self.logger.info(f"Saved {len(new_articles)} new articles to {file_path}")
-        return len(new_articles)
+        try:
+            file_path.parent.mkdir(exist_ok=True)
+            file_path.write_bytes(json_dumps({
+                'etag': etag,
+                'last_modified': last_modified,
+                'articles': [a.to_dict() for a in articles]
+            }))
+        except Exception as e:
+            self.logger.warning(f"Could not save feed cache: {e}")
     
-    def load_articles(self, topic: str = "all") -> List[Article]:
-        """Load articles from storage"""
-        file_path = self.data_dir / f"{topic}_articles.json"
+    def load_match_cache(self) -> dict:
+        """Load the Classifier's match cache saved by the previous run"""
+        file_path = self.data_dir / "match_cache.json"
         
         if not file_path.exists():
-            return []
+            return {}
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                return [Article.from_dict(d) for d in data]
+            return self._read_json(file_path)
+        except Exception as e:
+            self.logger.warning(f"Could not load match cache: {e}")
+            return {}
+    
+    def save_match_cache(self, cache: dict):
+        """Save the Classifier's match cache for the next run"""
+        file_path = self.data_dir / "match_cache.json"
+        file_path.write_bytes(json_dumps(cache))
+    
+    def load_articles(self, topic: str = "all") -> List[Article]:
+        """Load the most recent articles from storage"""
+        try:
+            # Pick the newest records first, then build Articles only for those
+            records = self._newest(self.iter_articles(topic))
         except Exception as e:
             self.logger.error(f"Could not load articles: {e}")
             return []
+        
+        return [Article.from_dict(d) for d in records]
+
+
+class ArticleWriter:
+    """Collects new articles for one topic's JSONL file (see Storage.open_writers)"""
+    
+    def __init__(self, storage: Storage, topic: str):
+        self.db = storage.db
+        self.topic = topic
+        self.path = storage.articles_path(topic)
+        self.pending: List[Article] = []
+        self.saved = 0
+    
+    def write(self, article: Article):
+        """
+        Queue the article unless this topic has already stored it
+        
+        The article is serialized later, in flush(), so the record
+        includes every topic classification adds to it.
+        """
+        # INSERT OR IGNORE only adds a row for ids we haven't seen yet
+        cursor = self.db.execute(
+            "INSERT OR IGNORE INTO seen (topic, id) VALUES (?, ?)",
+            (self.topic, article.id)
+        )
+        if cursor.rowcount:
+            self.pending.append(article)
+            self.saved += 1
+    
+    def flush(self):
+        """Append the queued records to the file"""
+        if not self.pending:
+            return
+        data = b"".join(json_dumps(a.to_dict()) + b"\n" for a in self.pending)
+        with open(self.path, 'a+b') as f:
+            # A crash mid-append can leave a partial last line; make sure
+            # our first record starts on a line of its own
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(data)
+        self.pending = []
 
 
 # ============================================================================
@@ -310,36 +1018,44 @@ class ReportGenerator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = self.output_dir / f"news_report_{timestamp}.md"
         
-        with open(report_path, 'w') as f:
-            # Write header
-            f.write("# News Report\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # Build the whole report as UTF-8 bytes, encoding once per section,
+        # and write it out with a single write() call
+        chunks: List[bytes] = []
+        
+        # Header and summary
+        total = sum(len(arts) for arts in classified.values())
+        chunks.append((
+            "# News Report\n"
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            f"**Total Articles:** {total}\n"
+            f"**Topics:** {', '.join(classified.keys())}\n\n"
+        ).encode('utf-8'))
+        
+        # Each topic
+        by_published = attrgetter('published')
+        for topic, articles in classified.items():
+            parts = [f"## {topic.title()}\n", f"*{len(articles)} articles*\n\n"]
             
-            # Write summary
-            total = sum(len(arts) for arts in classified.values())
-            f.write(f"**Total Articles:** {total}\n")
-            f.write(f"**Topics:** {', '.join(classified.keys())}\n\n")
+            # Newest N articles by date (a partial sort; no need to sort them all)
+            top_articles = heapq.nlargest(top_n, articles, key=by_published)
             
-            # Write each topic
-            for topic, articles in classified.items():
-                f.write(f"## {topic.title()}\n")
-                f.write(f"*{len(articles)} articles*\n\n")
+            for i, article in enumerate(top_articles, 1):
+                parts.append(f"### {i}. {article.title}\n")
+                parts.append(f"**Source:** {article.source}\n")
+                parts.append(f"**Link:** {article.url}\n")
                 
-                # Sort by date and take top N
-                articles.sort(key=lambda a: a.published or "", reverse=True)
+                if article.published:
+                    parts.append(f"**Published:** {article.published[:10]}\n")
                 
-                for i, article in enumerate(articles[:top_n], 1):
-                    f.write(f"### {i}. {article.title}\n")
-                    f.write(f"**Source:** {article.source}\n")
-                    f.write(f"**Link:** {article.url}\n")
-                    
-                    if article.published:
-                        f.write(f"**Published:** {article.published[:10]}\n")
-                    
-                    if article.summary:
-                        f.write(f"\n{article.summary[:200]}...\n")
-                    
-                    f.write("\n---\n\n")
+                if article.summary:
+                    parts.append(f"\n{article.summary[:200]}...\n")
+                
+                parts.append("\n---\n\n")
+            
+            chunks.append("".join(parts).encode('utf-8'))
+        
+        with open(report_path, 'wb') as f:
+            f.write(b"".join(chunks))
         
         self.logger.info(f"Report generated: {report_path}")
         print(f"\n📄 Report saved to: {report_path}")
@@ -367,20 +1083,26 @@ def load_config(config_file: Optional[str] = None) -> dict:
         'topics': [
             {
                 'name': 'AI',
+                # Keywords match whole words, so list plurals/variants too
                 'keywords': ['ai', 'artificial intelligence', 'machine learning', 
-                           'gpt', 'llm', 'neural', 'deep learning'],
+                           'gpt', 'chatgpt', 'llm', 'llms', 'neural',
+                           'deep learning'],
                 'exclude': []
             },
             {
                 'name': 'Security',
-                'keywords': ['security', 'vulnerability', 'breach', 'hack', 
-                           'cyber', 'malware', 'ransomware'],
+                'keywords': ['security', 'cybersecurity', 'vulnerability',
+                           'vulnerabilities', 'breach', 'breaches', 'hack',
+                           'hacked', 'hacker', 'hackers', 'hacking', 'cyber',
+                           'cyberattack', 'cyberattacks', 'malware',
+                           'ransomware'],
                 'exclude': []
             },
             {
                 'name': 'Programming',
                 'keywords': ['python', 'javascript', 'rust', 'golang', 'java',
-                           'programming', 'coding', 'developer', 'github'],
+                           'programming', 'coding', 'developer', 'developers',
+                           'github'],
                 'exclude': []
             }
         ]
@@ -461,16 +1183,13 @@ EXAMPLES:
         ]
     
     # Initialize components
-    fetcher = RSSFetcher()
-    classifier = Classifier(topics)
     storage = Storage()
+    fetcher = RSSFetcher(storage=storage)
+    classifier = Classifier(topics, match_cache=storage.load_match_cache())
     reporter = ReportGenerator()
     
-    # Fetch articles from all feeds
-    all_articles = []
-    for feed in config['feeds']:
-        articles = fetcher.fetch(feed['url'], feed.get('name'))
-        all_articles.extend(articles)
+    # Fetch articles from all feeds concurrently
+    all_articles = fetcher.fetch_all(config['feeds'])
     
     logger.info(f"Total articles fetched: {len(all_articles)}")
     
@@ -478,14 +1197,18 @@ EXAMPLES:
         logger.warning("No articles fetched. Check your internet connection and feed URLs.")
         return 1
     
-    # Classify articles
-    classified = classifier.classify(all_articles)
-    
-    # Save articles
-    storage.save_articles(all_articles, topic="all")
-    for topic, articles in classified.items():
-        if topic != 'uncategorized':
-            storage.save_articles(articles, topic=topic)
+    # Save every article to "all", then classify; each match is queued for
+    # its topic file as it's found, so topics need no second pass
+    with storage.open_writers(['all'] + [t.name for t in topics]) as writers:
+        for article in all_articles:
+            writers['all'].write(article)
+        
+        classified = classifier.classify(
+            all_articles,
+            on_match=lambda topic, article: writers[topic].write(article)
+        )
+    storage.save_match_cache(classifier.export_match_cache())
+    storage.close()
     
     # Generate report
     reporter.generate(classified, top_n=args.top_n)